@@ -6,6 +6,11 @@ from types import SimpleNamespace
 
 import requests
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from .exceptions import (
     PaperlessAuthorizationException,
     PaperlessException,
@@ -84,19 +89,28 @@ class PaperlessClient(object):
         params=None,
         retry_attempt_count=0,
         timeout=300,
+        stream=False,
     ):
         req_url = f'{self.base_url}/{url}'
 
         headers = self.get_authenticated_headers()
 
         method_to_call = getattr(requests, method)
+        if isinstance(data, str):
+            # http.client encodes str bodies as Latin-1, which mangles or rejects non-ASCII JSON
+            data = data.encode('utf-8')
         if data is not None:
             resp = method_to_call(
-                req_url, headers=headers, data=data, params=params, timeout=timeout
+                req_url,
+                headers=headers,
+                data=data,
+                params=params,
+                timeout=timeout,
+                stream=stream,
             )
         else:
             resp = method_to_call(
-                req_url, headers=headers, params=params, timeout=timeout
+                req_url, headers=headers, params=params, timeout=timeout, stream=stream
             )
 
         if (
@@ -122,7 +136,9 @@ class PaperlessClient(object):
                 LOGGER.error(e)
                 time.sleep(60)
             finally:
-                return self.request(url=url, method=method, data=data, params=params)
+                return self.request(
+                    url=url, method=method, data=data, params=params, stream=stream
+                )
         elif resp.status_code == 400:
             raise PaperlessException(
                 message="Failed to update resource: {}".format(resp.content),
@@ -146,6 +162,7 @@ class PaperlessClient(object):
                     data=data,
                     params=params,
                     retry_attempt_count=retry_attempt_count + 1,
+                    stream=stream,
                 )
             else:
                 raise PaperlessException(
@@ -166,6 +183,35 @@ class PaperlessClient(object):
         resp = self.request(url=list_url, method=self.METHODS.GET, params=params)
         return resp.json()
 
+    def stream_resource_list(self, list_url, params=None):
+        """
+        Streams a paginated list response, yielding each resource in its 'results' as soon as it has been decoded
+        rather than buffering and parsing the whole page first. Requires the optional ijson package.
+
+        :return: generator of resource dicts, whose return value is the page's 'next' url
+        """
+        resp = self.request(
+            url=list_url, method=self.METHODS.GET, params=params, stream=True
+        )
+        resp.raw.decode_content = True
+        next_url = None
+        builder = None
+        for prefix, event, value in ijson.parse(resp.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == 'results.item' and event in ('end_map', 'end_array'):
+                    yield builder.value
+                    builder = None
+            elif prefix == 'results.item':
+                if event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                else:
+                    yield value
+            elif prefix == 'next' and event in ('string', 'null'):
+                next_url = value
+        return next_url
+
     def get_resource(self, resource_url, id, params=None):
         """
             takes a resource type
@@ -3,6 +3,20 @@ from typing import List, Tuple
 
 from paperless.objects.utils import NO_UPDATE
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data):
+    """
+    Serializes data to a JSON string, using orjson when it is installed and the standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
 
 class BaseJSONEncoder(object):
     @classmethod
@@ -42,6 +56,6 @@ class SmartJSONEncoder(BaseJSONEncoder):
                 filtered_data[key] = data[key]
 
         if json_dumps:
-            return json.dumps(filtered_data)
+            return dumps(filtered_data)
         else:
             return filtered_data
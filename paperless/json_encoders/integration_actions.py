@@ -1,6 +1,4 @@
-import json
-
-from paperless.json_encoders import BaseJSONEncoder, SmartJSONEncoder
+from paperless.json_encoders import BaseJSONEncoder, SmartJSONEncoder, dumps
 from paperless.objects.utils import NO_UPDATE
 
 
@@ -25,7 +23,7 @@ class IntegrationActionEncoder(BaseJSONEncoder):
                 filtered_data[key] = data[key]
 
         if json_dumps:
-            return json.dumps(filtered_data)
+            return dumps(filtered_data)
         else:
             return filtered_data
 
@@ -51,7 +49,7 @@ class ManagedIntegrationEncoder(BaseJSONEncoder):
                 filtered_data[key] = data[key]
 
         if json_dumps:
-            return json.dumps(filtered_data)
+            return dumps(filtered_data)
         else:
             return filtered_data
 
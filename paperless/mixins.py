@@ -1,15 +1,148 @@
-import json
 import types
-import urllib.parse as urlparse
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
-from urllib.parse import parse_qs
 
 import attr
 
 from .api_mappers import BaseMapper
 from .client import PaperlessClient
-from .json_encoders import BaseJSONEncoder
+from .json_encoders import BaseJSONEncoder, dumps
 from .objects.common import BatchResponse, FailureResponse
+from .objects.utils import parse_next_query_params
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+MAX_PAGE_REQUEST_WORKERS = 8
+STREAMING_PAGE_SIZE = 1000
+
+
+def _get_resource_list_pages(client, list_url, params, page_numbers):
+    """
+    Fetches the given page numbers of a list endpoint concurrently.
+
+    :return: list of responses, in the order of page_numbers
+    """
+
+    def get_page(page):
+        page_params = dict(params or {})
+        page_params["page"] = page
+        return client.get_resource_list(list_url, params=page_params)
+
+    with ThreadPoolExecutor(max_workers=MAX_PAGE_REQUEST_WORKERS) as executor:
+        return list(executor.map(get_page, page_numbers))
+
+
+def _should_stream_pages(params):
+    """
+    Streaming pays off only for large pages, which callers request through the page_size param, and requires the
+    optional ijson package.
+    """
+    if ijson is None or not params:
+        return False
+    try:
+        return int(params.get("page_size", 0)) >= STREAMING_PAGE_SIZE
+    except (TypeError, ValueError):
+        return False
+
+
+def _stream_resource_list(client, list_url, params):
+    """
+    Yields every resource of a paginated list endpoint, decoding each page incrementally as it is received.
+    """
+    next_url = yield from client.stream_resource_list(list_url, params=params)
+    while next_url is not None:
+        next_query_params = parse_next_query_params(next_url)
+        if params is not None:
+            next_query_params.update(params)
+        next_url = yield from client.stream_resource_list(
+            list_url, params=next_query_params
+        )
+
+
+def _get_remaining_page_numbers(response, next_query_params, page_size):
+    """
+    Works out the page numbers left to fetch when a list endpoint paginates by page number and reports a total count.
+
+    :return: range of page numbers, or None if the pages can only be discovered by following the next links
+    """
+    count = response.get("count")
+    next_page = next_query_params.get("page")
+    if count is None or next_page is None or not page_size:
+        return None
+    try:
+        next_page = int(next_page)
+    except ValueError:
+        return None
+    last_page = -(-count // page_size)
+    return range(next_page, last_page + 1)
+
+
+def paginate(
+    client,
+    list_url,
+    params,
+    parse_list_response,
+    from_json,
+    pages=None,
+    allow_concurrent_pages=False,
+    allow_streaming=False,
+):
+    """
+    Collects every resource of a paginated list endpoint, following its next links.
+
+    :param params: dict of params for your list request
+    :param parse_list_response: callable stripping a response down to its json list of resources
+    :param from_json: callable turning a json resource into an object
+    :param pages: iterable of ints describing the indices of the pages you want (starting from 1); these are
+        fetched concurrently
+    :param allow_concurrent_pages: once the first page reports the total count, fetch the remaining pages in
+        parallel instead of following the next links one by one
+    :param allow_streaming: decode large pages incrementally when the endpoint supports it
+    :return: [resource]
+    """
+    if pages is not None:
+        return [
+            from_json(resource)
+            for response in _get_resource_list_pages(client, list_url, params, pages)
+            for resource in parse_list_response(response)
+        ]
+    if allow_streaming and _should_stream_pages(params):
+        return [
+            from_json(resource)
+            for resource in _stream_resource_list(client, list_url, params)
+        ]
+    response = client.get_resource_list(list_url, params=params)
+    first_page = parse_list_response(response)
+    resource_list: list = [from_json(resource) for resource in first_page]
+    while response["next"] is not None:
+        next_url: str = response["next"]
+        next_query_params: dict = parse_next_query_params(next_url)
+        if params is not None:
+            next_query_params.update(params)
+        remaining_pages = (
+            _get_remaining_page_numbers(response, next_query_params, len(first_page))
+            if allow_concurrent_pages
+            else None
+        )
+        if remaining_pages:
+            # every page URL is known up front, so fetch them concurrently. If the collection grew in the meantime
+            # the last page links onwards, and the loop follows those links serially.
+            for response in _get_resource_list_pages(
+                client, list_url, next_query_params, remaining_pages
+            ):
+                resource_list.extend(
+                    from_json(resource) for resource in parse_list_response(response)
+                )
+            allow_concurrent_pages = False
+            continue
+        response = client.get_resource_list(list_url, params=next_query_params)
+        resource_list.extend(
+            from_json(resource) for resource in parse_list_response(response)
+        )
+    return resource_list
 
 
 class FromJSONMixin(object):
@@ -20,6 +153,8 @@ class FromJSONMixin(object):
     Because of this, use the _mapper to specify how to map from the API to your resource.
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_json_to_dict(cls, resource):
         if hasattr(cls, "_mapper"):
@@ -27,16 +162,29 @@ class FromJSONMixin(object):
         else:
             return resource
 
+    @classmethod
+    def _get_copyable_fields(cls):
+        """
+        Returns the names of the fields explicitly defined on this attrs class. The set is computed once per class
+        and memoized on the class itself.
+
+        :raise NotAnAttrsClassError: Raised when this class is not an attrs class.
+        :return: frozenset of field names
+        """
+        fields = cls.__dict__.get("_copyable_fields")
+        if fields is None:
+            fields = frozenset(a.name for a in attr.fields(cls))
+            cls._copyable_fields = fields
+        return fields
+
     @classmethod
     def from_json(cls, resource: dict):
         try:
-            d = dict()
-            cls_attrs = [a.name for a in attr.fields(cls)]
-            for k, v in resource.items():
-                if k in cls_attrs:
-                    d[k] = v
+            cls_attrs = cls._get_copyable_fields()
         except attr.exceptions.NotAnAttrsClassError:
             d = resource
+        else:
+            d = {k: v for k, v in resource.items() if k in cls_attrs}
         return cls(**cls.from_json_to_dict(d))
 
     def update_with_response_data(self, response_data):
@@ -44,24 +192,31 @@ class FromJSONMixin(object):
         Update this instance with data from the given API response dictionary.
         """
         resp_obj = self.from_json(response_data)
+        if attr.has(resp_obj.__class__):
+            for key in resp_obj._get_copyable_fields():
+                setattr(self, key, getattr(resp_obj, key))
+            return
         # This filter is designed to remove methods, properties, and private data members and only let through the
         # fields explicitly defined in the class definition
-        keys = filter(
-            lambda x: not x.startswith("__")
-            and not x.startswith("_")
+        cls_members = set(dir(resp_obj.__class__))
+        keys = [
+            x
+            for x in dir(resp_obj)
+            if not x.startswith("_")
             and type(getattr(resp_obj, x)) != types.MethodType
             and (
                 not isinstance(getattr(resp_obj.__class__, x), property)
-                if x in dir(resp_obj.__class__)
+                if x in cls_members
                 else True
-            ),
-            dir(resp_obj),
-        )
+            )
+        ]
         for key in keys:
             setattr(self, key, getattr(resp_obj, key))
 
 
 class ReadMixin(object):
+    __slots__ = ()
+
     @classmethod
     def construct_get_url(cls):
         """
@@ -112,6 +267,7 @@ class ReadMixin(object):
 
 
 class ListMixin(object):
+    __slots__ = ()
     _list_mapper = BaseMapper
     _list_object_representation = None
 
@@ -157,6 +313,8 @@ class ListMixin(object):
 
 
 class PaginatedListMixin(ListMixin):
+    __slots__ = ()
+
     @classmethod
     def parse_list_response(cls, results):
         """
@@ -177,25 +335,13 @@ class PaginatedListMixin(ListMixin):
         :param pages: iterable of ints describing the indices of the pages you want (starting from 1)
         :return: [resource]
         """
-        client = PaperlessClient.get_instance()
-        response = client.get_resource_list(cls.construct_list_url(), params=params)
-        resource_list = cls.parse_list_response(response)
-        while response["next"] is not None:
-            next_url = response["next"]
-            next_query_params = parse_qs(urlparse.urlparse(next_url).query)
-            if params is not None:
-                next_query_params = {**next_query_params, **params}
-            response = client.get_resource_list(
-                cls.construct_list_url(), params=next_query_params
-            )
-            resource_list.extend(cls.parse_list_response(response))
-        if cls._list_object_representation:
-            return [
-                cls._list_object_representation.from_json(resource)
-                for resource in resource_list
-            ]
-        else:
-            return [cls.from_json(resource) for resource in resource_list]
+        return paginate(
+            PaperlessClient.get_instance(),
+            cls.construct_list_url(),
+            params,
+            cls.parse_list_response,
+            (cls._list_object_representation or cls).from_json,
+        )
 
 
 class ToDictMixin(object):
@@ -205,6 +351,8 @@ class ToDictMixin(object):
     :return: dict
     """
 
+    __slots__ = ()
+
     def to_dict(self):
         return attr.asdict(self, recurse=True)
 
@@ -216,6 +364,7 @@ class ToJSONMixin(object):
     :returns: json
     """
 
+    __slots__ = ()
     _json_encoder = BaseJSONEncoder
 
     def to_json(self):
@@ -223,6 +372,8 @@ class ToJSONMixin(object):
 
 
 class CreateMixin(object):
+    __slots__ = ()
+
     @classmethod
     def construct_post_url(cls):
         raise NotImplementedError
@@ -238,6 +389,7 @@ class CreateMixin(object):
 
 
 class UpdateMixin(object):
+    __slots__ = ()
     _primary_key = "id"
 
     @classmethod
@@ -257,7 +409,52 @@ class UpdateMixin(object):
         self.update_with_response_data(resp)
 
 
+class ChangeTrackingMixin(object):
+    """
+    Remembers the field values this instance last shared with Paperless Parts so that update() can skip the request
+    when nothing has changed locally. Only instances returned by get() or refreshed from a create/update response are
+    synced; instances from list() or constructed directly have no synced state and always update.
+
+    List this mixin before ReadMixin and UpdateMixin so its overrides wrap theirs.
+    """
+
+    __slots__ = ("_synced_values",)
+
+    def _get_field_values(self):
+        return tuple(getattr(self, a.name) for a in self.__class__.__attrs_attrs__)
+
+    def _mark_synced(self):
+        self._synced_values = self._get_field_values()
+
+    def has_local_changes(self):
+        """
+        :return: True if any field differs from the last synced state, or if this instance was never synced.
+        """
+        return getattr(self, "_synced_values", None) != self._get_field_values()
+
+    @classmethod
+    def get(cls, id):
+        instance = super().get(id)
+        instance._mark_synced()
+        return instance
+
+    def update_with_response_data(self, response_data):
+        super().update_with_response_data(response_data)
+        self._mark_synced()
+
+    def update(self, force=False):
+        """
+        Persists local changes of an existing Paperless Parts resource to Paperless. The request is skipped when
+        has_local_changes() is False, e.g. for an instance fetched with get() and not modified since.
+
+        :param force: send the request even if there are no local changes
+        """
+        if force or self.has_local_changes():
+            super().update()
+
+
 class DeleteMixin(object):
+    __slots__ = ()
     _primary_key = "id"
 
     def construct_delete_url(cls):
@@ -273,9 +470,8 @@ class DeleteMixin(object):
 
 
 class BatchMixin(object):
-    _list_key = (
-        "override_this"
-    )  # The field in the request schema in which to supply the list of objects
+    __slots__ = ()
+    _list_key = "override_this"  # The field in the request schema in which to supply the list of objects
 
     @classmethod
     def construct_batch_url(cls, **kwargs):
@@ -291,10 +487,12 @@ class BatchMixin(object):
             instance_dict = cls._json_encoder.encode(instance, json_dumps=False)
             instance_dict_list.append(instance_dict)
         data_dict = {cls._list_key: instance_dict_list}
-        return json.dumps(data_dict)
+        return dumps(data_dict)
 
 
 class BatchCreateMixin(BatchMixin):
+    __slots__ = ()
+
     @classmethod
     def create_many(cls, instances, **kwargs):
         """
@@ -313,6 +511,8 @@ class BatchCreateMixin(BatchMixin):
 
 
 class BatchUpdateMixin(BatchMixin):
+    __slots__ = ()
+
     @classmethod
     def update_many(cls, instances, **kwargs):
         """
@@ -331,6 +531,8 @@ class BatchUpdateMixin(BatchMixin):
 
 
 class BatchUpsertMixin(BatchMixin):
+    __slots__ = ()
+
     @classmethod
     def upsert_many(cls, instances, **kwargs):
         """
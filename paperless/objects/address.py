@@ -7,7 +7,7 @@ from paperless.mixins import FromJSONMixin, ToJSONMixin
 from paperless.objects.utils import NO_UPDATE
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=True, slots=True, hash=True)
 class Address(FromJSONMixin, ToJSONMixin):
 
     _json_encoder = AddressEncoder
@@ -1,4 +1,5 @@
 import decimal
+import functools
 import math
 from dataclasses import dataclass
 from decimal import Decimal, DecimalException
@@ -60,6 +61,21 @@ class Money:
         return bool(self.dollars)
 
 
+@functools.lru_cache(maxsize=4096)
+def _money_from_str(value):
+    return Money(value)
+
+
+def convert_money(value):
+    """Converter for Money fields. Money is immutable, so amounts given as the same string share one instance."""
+    if isinstance(value, Money):
+        return value
+    elif isinstance(value, str):
+        return _money_from_str(value)
+    else:
+        return Money(value)
+
+
 @attr.s(frozen=False)
 class Salesperson:
     email: str = attr.ib(validator=attr.validators.instance_of(str))
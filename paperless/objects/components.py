@@ -204,6 +204,8 @@ class AssemblyComponent(NamedTuple):
 class AssemblyMixin:
     """Add `iterate_assembly` method for use in OrderItems and QuoteItems."""
 
+    __slots__ = ()
+
     def iterate_assembly_with_duplicates(
         self
     ) -> Generator[AssemblyComponent, None, None]:
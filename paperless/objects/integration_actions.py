@@ -1,9 +1,6 @@
-import urllib.parse as urlparse
 from typing import Optional, Union
-from urllib.parse import parse_qs
 
 import attr
-import dateutil.parser
 
 from paperless.api_mappers import BaseMapper
 from paperless.client import PaperlessClient
@@ -15,18 +12,21 @@ from paperless.json_encoders.integration_actions import (
 from paperless.mixins import (
     BatchCreateMixin,
     BatchUpdateMixin,
+    ChangeTrackingMixin,
     FromJSONMixin,
     ListMixin,
     ReadMixin,
     ToJSONMixin,
     UpdateMixin,
+    paginate,
 )
 from paperless.objects.events import Event
-from paperless.objects.utils import NO_UPDATE
+from paperless.objects.utils import NO_UPDATE, parse_iso_datetime
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class IntegrationAction(
+    ChangeTrackingMixin,
     FromJSONMixin,
     ToJSONMixin,
     ReadMixin,
@@ -40,77 +40,46 @@ class IntegrationAction(
     _list_object_representation = None
     _json_encoder = IntegrationActionEncoder
     type = attr.ib(validator=attr.validators.instance_of(str))
-    entity_id = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    created = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    updated = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    uuid: Optional[str] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    status: Optional[str] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    status_message: Optional[str] = attr.ib(
-        default=NO_UPDATE, validator=attr.validators.instance_of((str, object))
-    )
-    current_record_count: Optional[int] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((int, object))),
-    )
-    last_checkin: Optional[str] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
+    entity_id = attr.ib(default=NO_UPDATE)
+    created = attr.ib(default=NO_UPDATE)
+    updated = attr.ib(default=NO_UPDATE)
+    uuid: Optional[str] = attr.ib(default=NO_UPDATE)
+    status: Optional[str] = attr.ib(default=NO_UPDATE)
+    status_message: Optional[str] = attr.ib(default=NO_UPDATE)
+    current_record_count: Optional[int] = attr.ib(default=NO_UPDATE)
+    last_checkin: Optional[str] = attr.ib(default=NO_UPDATE)
 
     @property
     def created_dt(self):
         return (
-            dateutil.parser.parse(self.created)
-            if isinstance(self.created, str)
-            else None
+            parse_iso_datetime(self.created) if isinstance(self.created, str) else None
         )
 
     @property
     def updated_dt(self):
         return (
-            dateutil.parser.parse(self.updated)
-            if isinstance(self.updated, str)
-            else None
+            parse_iso_datetime(self.updated) if isinstance(self.updated, str) else None
         )
 
     @property
     def last_checkin_dt(self):
         return (
-            dateutil.parser.parse(self.last_checkin)
+            parse_iso_datetime(self.last_checkin)
             if isinstance(self.last_checkin, str)
             else None
         )
 
     @classmethod
     def construct_post_url(cls, managed_integration_uuid):
-        return 'managed_integrations/public/{}/integration_actions'.format(
-            managed_integration_uuid
-        )
+        return f'managed_integrations/public/{managed_integration_uuid}/integration_actions'
 
     @classmethod
     def construct_batch_url(cls, managed_integration_uuid):
-        return 'managed_integrations/public/{}/integration_actions/batch'.format(
-            managed_integration_uuid
-        )
+        return f'managed_integrations/public/{managed_integration_uuid}/integration_actions/batch'
 
     @classmethod
     def construct_batch_post_url(cls, managed_integration_uuid):
-        return super().construct_batch_post_url(
+        return cls.construct_batch_url(
             managed_integration_uuid=managed_integration_uuid
         )
 
@@ -122,9 +91,7 @@ class IntegrationAction(
 
     @classmethod
     def construct_list_url(cls, managed_integration_uuid):
-        return 'managed_integrations/public/{}/integration_actions'.format(
-            managed_integration_uuid
-        )
+        return f'managed_integrations/public/{managed_integration_uuid}/integration_actions'
 
     def create(self, managed_integration_uuid):
         """
@@ -139,14 +106,15 @@ class IntegrationAction(
 
     @classmethod
     def create_many(cls, instances, managed_integration_uuid=None):
-        return super().create_many(
-            instances=instances, managed_integration_uuid=managed_integration_uuid
+        # attrs cannot rebuild slotted classes whose methods reference super, so call the mixin directly
+        return BatchCreateMixin.create_many.__func__(
+            cls, instances=instances, managed_integration_uuid=managed_integration_uuid
         )
 
     @classmethod
     def update_many(cls, instances, managed_integration_uuid=None):
-        return super().update_many(
-            instances=instances, managed_integration_uuid=managed_integration_uuid
+        return BatchUpdateMixin.update_many.__func__(
+            cls, instances=instances, managed_integration_uuid=managed_integration_uuid
         )
 
     @classmethod
@@ -161,39 +129,29 @@ class IntegrationAction(
         return results['results']
 
     @classmethod
-    def list(cls, managed_integration_uuid, params=None, pages=None):
+    def list(cls, managed_integration_uuid, params=None, pages=None, concurrent=False):
         """
         Returns a list of (1) either the minimal representation of this resource as defined by _list_object_representation or (2) a list of this resource.
 
         :param params: dict of params for your list request
         :param pages: iterable of ints describing the indices of the pages you want (starting from 1)
+        :param concurrent: fetch the remaining pages in parallel once the first page reports the total count
         :return: [resource]
         """
         client = PaperlessClient.get_instance()
-        response = client.get_resource_list(
-            cls.construct_list_url(managed_integration_uuid=managed_integration_uuid),
-            params=params,
+        list_url = cls.construct_list_url(
+            managed_integration_uuid=managed_integration_uuid
+        )
+        return paginate(
+            client,
+            list_url,
+            params,
+            cls.parse_list_response,
+            (cls._list_object_representation or cls).from_json,
+            pages=pages,
+            allow_concurrent_pages=concurrent,
+            allow_streaming=True,
         )
-        resource_list = cls.parse_list_response(response)
-        while response['next'] is not None:
-            next_url = response['next']
-            next_query_params = parse_qs(urlparse.urlparse(next_url).query)
-            if params is not None:
-                next_query_params = {**next_query_params, **params}
-            response = client.get_resource_list(
-                cls.construct_list_url(
-                    managed_integration_uuid=managed_integration_uuid
-                ),
-                params=next_query_params,
-            )
-            resource_list.extend(cls.parse_list_response(response))
-        if cls._list_object_representation:
-            return [
-                cls._list_object_representation.from_json(resource)
-                for resource in resource_list
-            ]
-        else:
-            return [cls.from_json(resource) for resource in resource_list]
 
     @classmethod
     def construct_get_url(cls):
@@ -203,6 +161,20 @@ class IntegrationAction(
     def construct_patch_url(cls):
         return 'integration_actions/public'
 
+    @classmethod
+    def construct_filter_params(cls, status=None, type=None):
+        """
+        Builds the query params for filter requests, leaving out any filters that were not supplied.
+
+        :return None or params dict
+        """
+        params = {
+            key: value
+            for key, value in (('status', status), ('type', type))
+            if value is not None
+        }
+        return params or None
+
     @classmethod
     def filter(
         cls,
@@ -212,7 +184,7 @@ class IntegrationAction(
     ):
         return cls.list(
             managed_integration_uuid=managed_integration_uuid,
-            params={'status': status, "type": type},
+            params=cls.construct_filter_params(status=status, type=type),
         )
 
     @classmethod
@@ -222,8 +194,7 @@ class IntegrationAction(
         status: Optional[str] = None,
         type: Optional[str] = None,
     ):
-
-        params = {'status': status, "type": type}
+        params = cls.construct_filter_params(status=status, type=type)
 
         client = PaperlessClient.get_instance()
         response = client.get_resource_list(
@@ -246,60 +217,42 @@ class IntegrationAction(
         return None
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class IntegrationActionDefinition(FromJSONMixin, ToJSONMixin):
     _primary_key = 'uuid'
     _list_object_representation = None
     name = attr.ib(validator=attr.validators.instance_of(str))
     type = attr.ib(validator=attr.validators.instance_of(str))
-    uuid: str = attr.ib(
-        default=NO_UPDATE, validator=attr.validators.instance_of((str, object))
-    )
-    related_object_type: Optional[str] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
+    uuid: str = attr.ib(default=NO_UPDATE)
+    related_object_type: Optional[str] = attr.ib(default=NO_UPDATE)
 
     @classmethod
-    def list(cls, managed_integration_uuid, params=None, pages=None):
+    def list(cls, managed_integration_uuid, params=None, pages=None, concurrent=False):
         """
         Returns a list of (1) either the minimal representation of this resource as defined by _list_object_representation or (2) a list of this resource.
 
         :param params: dict of params for your list request
         :param pages: iterable of ints describing the indices of the pages you want (starting from 1)
+        :param concurrent: fetch the remaining pages in parallel once the first page reports the total count
         :return: [resource]
         """
         client = PaperlessClient.get_instance()
-        response = client.get_resource_list(
-            cls.construct_list_url(managed_integration_uuid=managed_integration_uuid),
-            params=params,
+        list_url = cls.construct_list_url(
+            managed_integration_uuid=managed_integration_uuid
+        )
+        return paginate(
+            client,
+            list_url,
+            params,
+            cls.parse_list_response,
+            (cls._list_object_representation or cls).from_json,
+            pages=pages,
+            allow_concurrent_pages=concurrent,
         )
-        resource_list = cls.parse_list_response(response)
-        while response['next'] is not None:
-            next_url = response['next']
-            next_query_params = parse_qs(urlparse.urlparse(next_url).query)
-            if params is not None:
-                next_query_params = {**next_query_params, **params}
-            response = client.get_resource_list(
-                cls.construct_list_url(
-                    managed_integration_uuid=managed_integration_uuid
-                ),
-                params=next_query_params,
-            )
-            resource_list.extend(cls.parse_list_response(response))
-        if cls._list_object_representation:
-            return [
-                cls._list_object_representation.from_json(resource)
-                for resource in resource_list
-            ]
-        else:
-            return [cls.from_json(resource) for resource in resource_list]
 
     @classmethod
     def construct_list_url(cls, managed_integration_uuid):
-        return 'managed_integrations/public/{}/integration_action_definitions'.format(
-            managed_integration_uuid
-        )
+        return f'managed_integrations/public/{managed_integration_uuid}/integration_action_definitions'
 
     @classmethod
     def parse_list_response(cls, results):
@@ -313,23 +266,22 @@ class IntegrationActionDefinition(FromJSONMixin, ToJSONMixin):
         return results['results']
 
 
-@attr.s(frozen=False)
-class ManagedIntegration(FromJSONMixin, ToJSONMixin, ReadMixin, ListMixin, UpdateMixin):
+@attr.s(frozen=False, slots=True)
+class ManagedIntegration(
+    ChangeTrackingMixin,
+    FromJSONMixin,
+    ToJSONMixin,
+    ReadMixin,
+    ListMixin,
+    UpdateMixin,
+):
     _primary_key = 'uuid'
     _json_encoder = ManagedIntegrationEncoder
     erp_name = attr.ib(validator=attr.validators.instance_of(str))
-    is_active: bool = attr.ib(validator=attr.validators.instance_of((bool, object)))
-    erp_version: Optional[str] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    integration_version: Optional[str] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    uuid: str = attr.ib(
-        default=NO_UPDATE, validator=attr.validators.instance_of((str, object))
-    )
+    is_active: bool = attr.ib()
+    erp_version: Optional[str] = attr.ib(default=NO_UPDATE)
+    integration_version: Optional[str] = attr.ib(default=NO_UPDATE)
+    uuid: str = attr.ib(default=NO_UPDATE)
 
     @classmethod
     def construct_list_url(cls):
@@ -345,7 +297,7 @@ class ManagedIntegration(FromJSONMixin, ToJSONMixin, ReadMixin, ListMixin, Updat
 
     @classmethod
     def construct_event_list_url(cls, uuid):
-        return 'managed_integrations/public/{}/poll'.format(uuid)
+        return f'managed_integrations/public/{uuid}/poll'
 
     @classmethod
     def event_list(cls, uuid, params=None, pages=None):
@@ -356,14 +308,11 @@ class ManagedIntegration(FromJSONMixin, ToJSONMixin, ReadMixin, ListMixin, Updat
         :return: [resource]
         """
         client = PaperlessClient.get_instance()
-        response = client.get_resource_list(
-            cls.construct_event_list_url(uuid), params=params
-        )
+        event_list_url = cls.construct_event_list_url(uuid)
+        response = client.get_resource_list(event_list_url, params=params)
         resource_list = response['results']
         while response['has_more_events'] is True:
-            response = client.get_resource_list(
-                cls.construct_event_list_url(uuid), params=params
-            )
+            response = client.get_resource_list(event_list_url, params=params)
             resource_list.extend(response['results'])
         return [Event.from_json(resource) for resource in resource_list]
 
@@ -374,18 +323,12 @@ class IntegrationActionError(FromJSONMixin, ToJSONMixin, BatchCreateMixin):
     _json_encoder = IntegrationActionErrorEncoder
     error_message: str = attr.ib(validator=attr.validators.instance_of(str))
     reference_id: str = attr.ib(validator=attr.validators.instance_of(str))
-    cause: Optional[Union[str, object]] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    uuid: Optional[Union[str, object]] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
+    cause: Optional[Union[str, object]] = attr.ib(default=NO_UPDATE)
+    uuid: Optional[Union[str, object]] = attr.ib(default=NO_UPDATE)
 
     @classmethod
     def construct_batch_url(cls, integration_action_uuid):
-        return 'integration_actions/public/{}/errors'.format(integration_action_uuid)
+        return f'integration_actions/public/{integration_action_uuid}/errors'
 
     @classmethod
     def create_many(cls, instances, integration_action_uuid):
@@ -19,10 +19,11 @@ from paperless.objects.components import BaseOperation
 from paperless.objects.suppliers import SupplierFacility
 from paperless.objects.utils import NO_UPDATE
 
-from .common import Money, Salesperson
+from .common import Money, Salesperson, convert_money
 from .components import AssemblyMixin, BaseComponent
 from .utils import (
     convert_cls,
+    convert_decimal,
     convert_dictionary,
     convert_iterable,
     numeric_validator,
@@ -30,7 +31,36 @@ from .utils import (
 )
 
 
-@attr.s(frozen=True)
+def _opt_is(type_):
+    """Validator allowing None or an instance of type_. Equivalent to optional(instance_of(type_)), with one call
+    per field instead of two."""
+
+    def validator(instance, attribute, value):
+        if value is not None and not isinstance(value, type_):
+            raise TypeError(
+                "'{name}' must be {type!r} (got {value!r} that is a {actual!r}).".format(
+                    name=attribute.name, type=type_, actual=value.__class__, value=value
+                ),
+                attribute,
+                type_,
+                value,
+            )
+
+    return validator
+
+
+# Shared validator instances, so each field does not build its own
+_V_STR = attr.validators.instance_of(str)
+_V_INT = attr.validators.instance_of(int)
+_V_BOOL = attr.validators.instance_of(bool)
+_V_MONEY = attr.validators.instance_of(Money)
+_V_OPT_STR = _opt_is(str)
+_V_OPT_INT = _opt_is(int)
+_V_OPT_MONEY = _opt_is(Money)
+_V_OPT_DECIMAL = _opt_is(Decimal)
+
+
+@attr.s(frozen=True, slots=True)
 class CostingVariablePayload:
     value: Optional[Union[float, int, str, bool]] = attr.ib()
     # NOTE: row will only not be None if parent QuoteCostingVariable.variable_class == 'drop_down'
@@ -39,10 +69,10 @@ class CostingVariablePayload:
     options: Optional[List[Union[float, int, str]]] = attr.ib()
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class QuoteCostingVariable:
     value = attr.ib()
-    label: str = attr.ib(validator=attr.validators.instance_of(str))
+    label: str = attr.ib(validator=_V_STR)
     quantity_specific: bool = attr.ib()
     quantities: Dict[int, CostingVariablePayload] = attr.ib(
         converter=convert_dictionary(CostingVariablePayload)
@@ -51,8 +81,15 @@ class QuoteCostingVariable:
     value_type: str = attr.ib(attr.validators.instance_of(str))
 
 
-@attr.s(frozen=True)
-class QuoteCostingVariableMixin:
+class _LabelIndexSlot:
+    """Holds the slot QuoteCostingVariableMixin caches its label lookup in; attrs replaces __slots__ declared on
+    the attrs class itself."""
+
+    __slots__ = ('_label_index',)
+
+
+@attr.s(frozen=True, slots=True)
+class QuoteCostingVariableMixin(_LabelIndexSlot):
     """
     Mixin for quote objects that have a costing_variables field (e.g. operations, add-ons, pricing items)
     """
@@ -61,170 +98,150 @@ class QuoteCostingVariableMixin:
         converter=convert_iterable(QuoteCostingVariable)
     )
 
+    def _get_label_index(self) -> Dict[str, QuoteCostingVariable]:
+        """Return a dict of costing variables by label. It is built on first use and rebuilt only when
+        costing_variables is reassigned; assign a new list rather than editing it in place."""
+        try:
+            costing_variables, label_index = self._label_index
+        except AttributeError:
+            costing_variables = label_index = None
+        if costing_variables is not self.costing_variables:
+            costing_variables = self.costing_variables
+            label_index = {cv.label: cv for cv in costing_variables}
+            object.__setattr__(self, '_label_index', (costing_variables, label_index))
+        return label_index
+
     def get_variable_for_qty(
         self, label: str, qty: int
     ) -> Optional[CostingVariablePayload]:
         """Return the value of the variable with the specified label for the given quantity or None if
         that variable does not exist."""
-        return (
-            {cv.label: cv.quantities for cv in self.costing_variables}
-            .get(label, dict())
-            .get(qty, None)
-        )
+        cv = self._get_label_index().get(label)
+        return cv.quantities.get(qty, None) if cv is not None else None
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class QuoteOperation(BaseOperation, QuoteCostingVariableMixin):
     # TODO: deprecate this
     def get_variable(self, label):
         """Return the value of the variable with the specified label or None if
         that variable does not exist."""
-        return {cv.label: cv.value for cv in self.costing_variables}.get(label, None)
+        cv = self._get_label_index().get(label)
+        return cv.value if cv is not None else None
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class AddOnQuantity:
     price: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
     manual_price: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
-    quantity: int = attr.ib(validator=attr.validators.instance_of(int))
+    quantity: int = attr.ib(validator=_V_INT)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class AddOn(QuoteCostingVariableMixin):
-    is_required: bool = attr.ib(validator=attr.validators.instance_of(bool))
-    name: str = attr.ib(validator=attr.validators.instance_of(str))
-    notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    is_required: bool = attr.ib(validator=_V_BOOL)
+    name: str = attr.ib(validator=_V_STR)
+    notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
     quantities: List[AddOnQuantity] = attr.ib(converter=convert_iterable(AddOnQuantity))
-    add_on_definition_erp_code: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    add_on_definition_erp_code: Optional[str] = attr.ib(validator=_V_OPT_STR)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class PricingItemQuantity:
     calculated_profit: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
     calculated_percentage: Optional[Decimal] = attr.ib(
-        converter=optional_convert(Decimal),
-        validator=attr.validators.optional(attr.validators.instance_of(Decimal)),
+        converter=optional_convert(convert_decimal),
+        validator=_V_OPT_DECIMAL,
     )
     manual_profit: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
     manual_percentage: Optional[Decimal] = attr.ib(
-        converter=optional_convert(Decimal),
-        validator=attr.validators.optional(attr.validators.instance_of(Decimal)),
+        converter=optional_convert(convert_decimal),
+        validator=_V_OPT_DECIMAL,
     )
-    quantity: int = attr.ib(validator=attr.validators.instance_of(int))
+    quantity: int = attr.ib(validator=_V_INT)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class PricingItem(QuoteCostingVariableMixin):
-    name: str = attr.ib(validator=attr.validators.instance_of(str))
-    category: str = attr.ib(validator=attr.validators.instance_of(str))
-    calculation_type: str = attr.ib(validator=attr.validators.instance_of(str))
-    notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    name: str = attr.ib(validator=_V_STR)
+    category: str = attr.ib(validator=_V_STR)
+    calculation_type: str = attr.ib(validator=_V_STR)
+    notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
     pricing_item_quantities: List[PricingItemQuantity] = attr.ib(
         converter=convert_iterable(PricingItemQuantity)
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Expedite:
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
-    lead_time: int = attr.ib(validator=attr.validators.instance_of(int))
+    id: int = attr.ib(validator=_V_INT)
+    lead_time: int = attr.ib(validator=_V_INT)
     markup: float = attr.ib(validator=numeric_validator)
-    unit_price: Money = attr.ib(
-        converter=Money, validator=attr.validators.instance_of(Money)
-    )
-    total_price: Money = attr.ib(
-        converter=Money, validator=attr.validators.instance_of(Money)
-    )
+    unit_price: Money = attr.ib(converter=convert_money, validator=_V_MONEY)
+    total_price: Money = attr.ib(converter=convert_money, validator=_V_MONEY)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Quantity:
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
-    quantity: int = attr.ib(validator=attr.validators.instance_of(int))
+    id: int = attr.ib(validator=_V_INT)
+    quantity: int = attr.ib(validator=_V_INT)
     markup_1_price: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
-    )
-    markup_1_name: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
+    markup_1_name: Optional[str] = attr.ib(validator=_V_OPT_STR)
     markup_2_price: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
-    )
-    markup_2_name: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    unit_price: Money = attr.ib(
-        converter=Money, validator=attr.validators.instance_of(Money)
-    )
-    total_price: Money = attr.ib(
-        converter=Money, validator=attr.validators.instance_of(Money)
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
+    markup_2_name: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    unit_price: Money = attr.ib(converter=convert_money, validator=_V_MONEY)
+    total_price: Money = attr.ib(converter=convert_money, validator=_V_MONEY)
     total_price_with_required_add_ons: Money = attr.ib(
-        converter=Money, validator=attr.validators.instance_of(Money)
+        converter=convert_money, validator=_V_MONEY
     )
-    lead_time: int = attr.ib(validator=attr.validators.instance_of(int))
+    lead_time: int = attr.ib(validator=_V_INT)
     expedites: List[Expedite] = attr.ib(converter=convert_iterable(Expedite))
-    is_most_likely_won_quantity: bool = attr.ib(
-        validator=attr.validators.instance_of(bool)
-    )
-    most_likely_won_quantity_percent: Optional[int] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(int))
-    )
-    make_quantity: Optional[int] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(int))
-    )
-    deliver_quantity: Optional[int] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(int))
-    )
+    is_most_likely_won_quantity: bool = attr.ib(validator=_V_BOOL)
+    most_likely_won_quantity_percent: Optional[int] = attr.ib(validator=_V_OPT_INT)
+    make_quantity: Optional[int] = attr.ib(validator=_V_OPT_INT)
+    deliver_quantity: Optional[int] = attr.ib(validator=_V_OPT_INT)
     total_raw_material_cost: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
     total_inside_processing_cost: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
     total_outside_processing_cost: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
     total_purchased_component_cost: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
     total_component_overrides_cost: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
-    )
-    yield_pct: Union[int, float, object] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(
-            attr.validators.instance_of((int, float, object))
-        ),
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
+    yield_pct: Union[int, float, object] = attr.ib(default=NO_UPDATE)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class QuoteComponent(BaseComponent):
     add_ons: List[AddOn] = attr.ib(converter=convert_iterable(AddOn))
     pricing_items: List[PricingItem] = attr.ib(converter=convert_iterable(PricingItem))
@@ -237,101 +254,79 @@ class QuoteComponent(BaseComponent):
     quantities: List[Quantity] = attr.ib(converter=convert_iterable(Quantity))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Metrics:
-    order_revenue_all_time: Money = attr.ib(
-        converter=Money, validator=attr.validators.instance_of(Money)
-    )
+    order_revenue_all_time: Money = attr.ib(converter=convert_money, validator=_V_MONEY)
     order_revenue_last_thirty_days: Money = attr.ib(
-        converter=Money, validator=attr.validators.instance_of(Money)
-    )
-    quotes_sent_all_time: int = attr.ib(validator=attr.validators.instance_of(int))
-    quotes_sent_last_thirty_days: int = attr.ib(
-        validator=attr.validators.instance_of(int)
+        converter=convert_money, validator=_V_MONEY
     )
+    quotes_sent_all_time: int = attr.ib(validator=_V_INT)
+    quotes_sent_last_thirty_days: int = attr.ib(validator=_V_INT)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Company:
-    id: Optional[int] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(int))
-    )
-    notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    id: Optional[int] = attr.ib(validator=_V_OPT_INT)
+    notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
     metrics: Metrics = attr.ib(converter=convert_cls(Metrics))
-    business_name: str = attr.ib(validator=attr.validators.instance_of(str))
-    erp_code: str = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    business_name: str = attr.ib(validator=_V_STR)
+    erp_code: str = attr.ib(validator=_V_OPT_STR)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Account:
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
-    notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    name: str = attr.ib(validator=attr.validators.instance_of(str))
-    erp_code: str = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    id: int = attr.ib(validator=_V_INT)
+    notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    name: str = attr.ib(validator=_V_STR)
+    erp_code: str = attr.ib(validator=_V_OPT_STR)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Customer:
-    id: Optional[int] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(int))
-    )
-    first_name: str = attr.ib(validator=attr.validators.instance_of(str))
-    last_name: str = attr.ib(validator=attr.validators.instance_of(str))
-    email: str = attr.ib(validator=attr.validators.instance_of(str))
-    notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    id: Optional[int] = attr.ib(validator=_V_OPT_INT)
+    first_name: str = attr.ib(validator=_V_STR)
+    last_name: str = attr.ib(validator=_V_STR)
+    email: str = attr.ib(validator=_V_STR)
+    notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
     company: Company = attr.ib(converter=convert_cls(Company))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Contact:
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
-    first_name: str = attr.ib(validator=attr.validators.instance_of(str))
-    last_name: str = attr.ib(validator=attr.validators.instance_of(str))
-    email: str = attr.ib(validator=attr.validators.instance_of(str))
-    notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    phone: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    phone_ext: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    id: int = attr.ib(validator=_V_INT)
+    first_name: str = attr.ib(validator=_V_STR)
+    last_name: str = attr.ib(validator=_V_STR)
+    email: str = attr.ib(validator=_V_STR)
+    notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    phone: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    phone_ext: Optional[str] = attr.ib(validator=_V_OPT_STR)
     account: Account = attr.ib(converter=convert_cls(Account))
 
 
-@attr.s(frozen=False)
-class QuoteItem(AssemblyMixin):
+class _ComponentIndexSlot:
+    """Holds the slot QuoteItem caches its component lookups in."""
+
+    __slots__ = ('_component_index',)
+
+
+@attr.s(frozen=False, slots=True)
+class QuoteItem(AssemblyMixin, _ComponentIndexSlot):
     NOT_STARTED = 'not_started'
     IN_PROGRESS = 'in_progress'
     ON_HOLD = 'on_hold'
     COMPLETED = 'completed'
     NO_QUOTE = 'no_quote'
 
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
+    id: int = attr.ib(validator=_V_INT)
     components: List[QuoteComponent] = attr.ib(
         converter=convert_iterable(QuoteComponent)
     )
-    type: str = attr.ib(validator=attr.validators.instance_of(str))
-    position: int = attr.ib(validator=attr.validators.instance_of(int))
-    export_controlled: bool = attr.ib(validator=attr.validators.instance_of(bool))
+    type: str = attr.ib(validator=_V_STR)
+    position: int = attr.ib(validator=_V_INT)
+    export_controlled: bool = attr.ib(validator=_V_BOOL)
     component_ids: List[int] = attr.ib(validator=attr.validators.instance_of(list))
-    private_notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    public_notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
+    private_notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    public_notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
     workflow_status: Optional[str] = attr.ib(
         validator=attr.validators.optional(
             attr.validators.in_(
@@ -340,53 +335,61 @@ class QuoteItem(AssemblyMixin):
         )
     )
 
+    def _get_component_index(self):
+        """Return the root component (or None) and a dict of components by id. Both are built on first use and
+        rebuilt only when components is reassigned; assign a new list rather than editing it in place."""
+        try:
+            components, root_component, components_by_id = self._component_index
+        except AttributeError:
+            components = None
+        if components is not self.components:
+            components = self.components
+            root_component = next((c for c in components if c.is_root_component), None)
+            # built in reverse so the first component with a given id wins
+            components_by_id = {c.id: c for c in reversed(components)}
+            self._component_index = (components, root_component, components_by_id)
+        return root_component, components_by_id
+
     @property
     def root_component(self):
-        try:
-            return [c for c in self.components if c.is_root_component][0]
-        except IndexError:
+        root_component, _ = self._get_component_index()
+        if root_component is None:
             raise ValueError('Order item has no root component')
+        return root_component
 
     def get_component(self, component_id: int) -> QuoteComponent:
-        for component in self.components:
-            if component.id == component_id:
-                return component
+        _, components_by_id = self._get_component_index()
+        return components_by_id.get(component_id)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class ParentQuote:
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
-    number: int = attr.ib(validator=attr.validators.instance_of(int))
-    status: str = attr.ib(validator=attr.validators.instance_of(str))
+    id: int = attr.ib(validator=_V_INT)
+    number: int = attr.ib(validator=_V_INT)
+    status: str = attr.ib(validator=_V_STR)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class ParentSupplierOrder:
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
-    number: int = attr.ib(validator=attr.validators.instance_of(int))
-    status: str = attr.ib(validator=attr.validators.instance_of(str))
+    id: int = attr.ib(validator=_V_INT)
+    number: int = attr.ib(validator=_V_INT)
+    status: str = attr.ib(validator=_V_STR)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class RequestForQuote:
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
-    email: str = attr.ib(validator=attr.validators.instance_of(str))
-    first_name: str = attr.ib(validator=attr.validators.instance_of(str))
-    last_name: str = attr.ib(validator=attr.validators.instance_of(str))
-    business_name: str = attr.ib(validator=attr.validators.instance_of(str))
-    phone: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    phone_ext: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    requested_delivery_date: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    contact_info_conflict: bool = attr.ib(validator=attr.validators.instance_of(bool))
-
-
-@attr.s(frozen=False)
+    id: int = attr.ib(validator=_V_INT)
+    email: str = attr.ib(validator=_V_STR)
+    first_name: str = attr.ib(validator=_V_STR)
+    last_name: str = attr.ib(validator=_V_STR)
+    business_name: str = attr.ib(validator=_V_STR)
+    phone: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    phone_ext: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    requested_delivery_date: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    contact_info_conflict: bool = attr.ib(validator=_V_BOOL)
+
+
+@attr.s(frozen=False, slots=True)
 class Quote(
     FromJSONMixin, ListMixin, ToDictMixin, UpdateMixin, ToJSONMixin
 ):  # We don't use ReadMixin here because quotes are identified uniquely by (number, revision) pairs
@@ -398,85 +401,54 @@ class Quote(
     _mapper = QuoteDetailsMapper
     _json_encoder = QuoteEncoder
 
-    id: int = attr.ib(validator=attr.validators.instance_of(int))
-    number: int = attr.ib(validator=attr.validators.instance_of(int))
-    revision_number: Optional[int] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(int))
-    )
+    id: int = attr.ib(validator=_V_INT)
+    number: int = attr.ib(validator=_V_INT)
+    revision_number: Optional[int] = attr.ib(validator=_V_OPT_INT)
     sales_person: Salesperson = attr.ib(converter=convert_cls(Salesperson))
     salesperson: Salesperson = attr.ib(converter=convert_cls(Salesperson))
     estimator: Salesperson = attr.ib(converter=convert_cls(Salesperson))
     contact: Contact = attr.ib(converter=convert_cls(Contact))
     customer: Customer = attr.ib(converter=convert_cls(Customer))
     tax_rate: Optional[Decimal] = attr.ib(
-        converter=optional_convert(Decimal),
-        validator=attr.validators.optional(attr.validators.instance_of(Decimal)),
+        converter=optional_convert(convert_decimal),
+        validator=_V_OPT_DECIMAL,
     )
     tax_cost: Optional[Money] = attr.ib(
-        converter=optional_convert(Money),
-        validator=attr.validators.optional(attr.validators.instance_of(Money)),
-    )
-    private_notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
+        converter=optional_convert(convert_money),
+        validator=_V_OPT_MONEY,
     )
+    private_notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
     quote_items: List[QuoteItem] = attr.ib(converter=convert_iterable(QuoteItem))
-    status: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    sent_date: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    expired_date: str = attr.ib(validator=attr.validators.instance_of(str))
-    due_date: str = attr.ib(validator=attr.validators.instance_of(str))
-    quote_notes: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    export_controlled: bool = attr.ib(validator=attr.validators.instance_of(bool))
-    digital_last_viewed_on: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    expired: bool = attr.ib(validator=attr.validators.instance_of(bool))
+    status: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    sent_date: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    expired_date: str = attr.ib(validator=_V_STR)
+    due_date: str = attr.ib(validator=_V_STR)
+    quote_notes: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    export_controlled: bool = attr.ib(validator=_V_BOOL)
+    digital_last_viewed_on: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    expired: bool = attr.ib(validator=_V_BOOL)
     request_for_quote: Optional[RequestForQuote] = attr.ib(
         converter=convert_cls(RequestForQuote),
-        validator=attr.validators.optional(
-            attr.validators.instance_of(RequestForQuote)
-        ),
+        validator=_opt_is(RequestForQuote),
     )
     parent_quote: Optional[ParentQuote] = attr.ib(
         converter=convert_cls(ParentQuote),
-        validator=attr.validators.optional(attr.validators.instance_of(ParentQuote)),
+        validator=_opt_is(ParentQuote),
     )
     parent_supplier_order: Optional[ParentSupplierOrder] = attr.ib(
         converter=convert_cls(ParentSupplierOrder),
-        validator=attr.validators.optional(
-            attr.validators.instance_of(ParentSupplierOrder)
-        ),
+        validator=_opt_is(ParentSupplierOrder),
     )
-    authenticated_pdf_quote_url: Optional[str] = attr.ib(
-        validator=attr.validators.optional(attr.validators.instance_of(str))
-    )
-    is_unviewed_drafted_rfq: bool = attr.ib(validator=attr.validators.instance_of(bool))
-    created: str = attr.ib(validator=attr.validators.instance_of(str))
+    authenticated_pdf_quote_url: Optional[str] = attr.ib(validator=_V_OPT_STR)
+    is_unviewed_drafted_rfq: bool = attr.ib(validator=_V_BOOL)
+    created: str = attr.ib(validator=_V_STR)
     send_from_facility: Optional[SupplierFacility] = attr.ib(
         converter=convert_cls(SupplierFacility),
-        validator=attr.validators.optional(
-            attr.validators.instance_of(SupplierFacility)
-        ),
-    )
-    erp_code: Union[str, object] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    rfq_number: Union[str, object] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(attr.validators.instance_of((str, object))),
-    )
-    priority: Union[int, float, object] = attr.ib(
-        default=NO_UPDATE,
-        validator=attr.validators.optional(
-            attr.validators.instance_of((int, float, object))
-        ),
+        validator=_opt_is(SupplierFacility),
     )
+    erp_code: Union[str, object] = attr.ib(default=NO_UPDATE)
+    rfq_number: Union[str, object] = attr.ib(default=NO_UPDATE)
+    priority: Union[int, float, object] = attr.ib(default=NO_UPDATE)
 
     @classmethod
     def construct_get_url(cls):
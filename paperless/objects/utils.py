@@ -1,4 +1,10 @@
+import datetime
+import functools
+from decimal import Decimal
+from urllib.parse import unquote_plus
+
 import attr
+import dateutil.parser
 
 NO_UPDATE = object()
 
@@ -30,6 +36,19 @@ def convert_iterable(cl):
     return converter
 
 
+@functools.lru_cache(maxsize=4096)
+def _decimal_from_str(value):
+    return Decimal(value)
+
+
+def convert_decimal(value):
+    """Converter for Decimal fields. Decimals are immutable, so values given as the same string share one
+    instance."""
+    if isinstance(value, str):
+        return _decimal_from_str(value)
+    return Decimal(value)
+
+
 def optional_convert(convert):
     """Invoke the subconverter only if the value is present."""
 
@@ -57,6 +76,16 @@ def convert_dictionary(cl):
     return converter
 
 
+@functools.lru_cache(maxsize=1024)
+def parse_iso_datetime(value):
+    """Parse an ISO-8601 timestamp from the API. Results are memoized on the raw string, since datetimes are
+    immutable. Falls back to dateutil for strings that datetime.fromisoformat does not accept."""
+    try:
+        return datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return dateutil.parser.parse(value)
+
+
 def phone_length_validator(instance, attribute, value):
     if value == NO_UPDATE or None:
         return
@@ -109,3 +138,16 @@ def get_metadata_filter_query_params(metadata: dict):
         key = f'metadata[{k}]'
         params[key] = v
     return params
+
+
+def parse_next_query_params(next_url):
+    """Extract the query params of a pagination 'next' URL as a dict of single values. Blank values are dropped,
+    matching urllib.parse.parse_qs."""
+    _, _, query = next_url.partition('?')
+    query, _, _ = query.partition('#')
+    params = {}
+    for pair in query.split('&'):
+        key, _, value = pair.partition('=')
+        if value:
+            params[unquote_plus(key)] = unquote_plus(value)
+    return params
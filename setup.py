@@ -2,7 +2,7 @@ import io
 import os
 import sys
 
-from setuptools import Command, find_packages, setup
+from setuptools import Command, Extension, find_packages, setup
 
 # Package meta-data.
 NAME = 'core-python'
@@ -15,6 +15,9 @@ VERSION = '0.7.0'
 
 REQUIRED = ['attrs', 'factory_boy', 'Faker', 'requests']
 
+# Optional packages: `fast` for orjson serialization, `stream` for incremental list parsing.
+EXTRAS = {'fast': ['orjson'], 'stream': ['ijson']}
+
 here = os.path.abspath(os.path.dirname(__file__))
 try:
     with io.open(os.path.join(here, 'README.md'), encoding='utf-8') as f:
@@ -22,6 +25,31 @@ try:
 except FileNotFoundError:
     long_description = DESCRIPTION
 
+# Optionally compile the hot pagination and integration action modules with Cython (pure-Python mode).
+# The extensions are marked optional, so the interpreted .py is used if compilation fails.
+CYTHON_MODULES = ['paperless/mixins.py', 'paperless/objects/integration_actions.py']
+ext_modules = []
+if os.environ.get('PAPERLESS_BUILD_CYTHON') == '1':
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print(
+            'PAPERLESS_BUILD_CYTHON is set but Cython is not installed.',
+            file=sys.stderr,
+        )
+    else:
+        ext_modules = cythonize(
+            [
+                Extension(path[: -len('.py')].replace('/', '.'), [path], optional=True)
+                for path in CYTHON_MODULES
+            ],
+            compiler_directives={
+                'language_level': 3,
+                'boundscheck': False,
+                'wraparound': False,
+            },
+        )
+
 # Where the magic happens:
 setup(
     name=NAME,
@@ -35,6 +63,8 @@ setup(
     url=URL,
     packages=find_packages(exclude=["tests", "*.tests", "*.tests.*", "tests.*"]),
     install_requires=REQUIRED,
+    extras_require=EXTRAS,
+    ext_modules=ext_modules,
     include_package_data=True,
     license='LGPL-3.0',
     classifiers=[
@@ -1,7 +1,10 @@
+import json
 import unittest
+from unittest.mock import MagicMock, patch
 
 from paperless.client import PaperlessClient
 from paperless.exceptions import PaperlessAuthorizationException
+from paperless.json_encoders import dumps
 
 
 class TestClient(unittest.TestCase):
@@ -43,3 +46,20 @@ class TestClient(unittest.TestCase):
         self.assertEqual(
             headers['Authorization'], 'API-Token {}'.format(self.access_token)
         )
+
+    def test_non_ascii_body_is_sent_as_utf8(self):
+        """
+        JSON bodies are sent as UTF-8 bytes, so non-ASCII text survives the request.
+        """
+        client = PaperlessClient.get_instance()
+        client.access_token = self.access_token
+        payload = {'notes': '\u00d8 5mm \u00b10.1 \u2300'}
+        with patch('requests.patch', return_value=MagicMock(status_code=200)) as mock:
+            client.request(
+                url='quotes/public/1',
+                method=PaperlessClient.METHODS.PATCH,
+                data=dumps(payload),
+            )
+        _, kwargs = mock.call_args
+        self.assertIsInstance(kwargs['data'], bytes)
+        self.assertEqual(json.loads(kwargs['data'].decode('utf-8')), payload)
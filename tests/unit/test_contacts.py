@@ -29,6 +29,7 @@ class TestContact(unittest.TestCase):
         self.assertEqual(c.address.country, "USA")
         self.assertEqual(c.address.postal_code, "02114-1702")
         self.assertEqual(c.address.state, "MA")
+        self.assertEqual(len({c.address, Contact.get(1).address}), 1)
         self.assertEqual(c.created, "2021-01-11T23:57:59.114838Z")
         self.assertEqual(c.email, "john.smith@paperlessparts.com")
         self.assertEqual(c.first_name, "John")
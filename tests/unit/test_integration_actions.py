@@ -1,10 +1,14 @@
 import datetime
+import io
 import json
+import subprocess
+import sys
 import unittest
 from typing import Optional, Union
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from paperless.client import PaperlessClient
+from paperless.mixins import ijson
 from paperless.objects.integration_actions import (
     IntegrationAction,
     IntegrationActionDefinition,
@@ -15,41 +19,59 @@ from paperless.objects.utils import NO_UPDATE
 
 
 class TestIntegrationAction(unittest.TestCase):
-    def setUp(self):
-        self.client = PaperlessClient()
+    @classmethod
+    def setUpClass(cls):
         with open(
             'tests/unit/mock_data/managed_integration.json'
         ) as single_integration_data:
-            self.mock_managed_integration_json = json.load(single_integration_data)
+            cls.mock_managed_integration_json = json.load(single_integration_data)
         with open(
             'tests/unit/mock_data/managed_integration_list.json'
         ) as list_integration_data:
-            self.mock_managed_integration_list_json = json.load(list_integration_data)
+            cls.mock_managed_integration_list_json = json.load(list_integration_data)
         with open('tests/unit/mock_data/integration_action.json') as single_action_data:
-            self.mock_integration_action_json = json.load(single_action_data)
+            cls.mock_integration_action_json = json.load(single_action_data)
         with open(
             'tests/unit/mock_data/integration_action_list.json'
         ) as list_actions_data:
-            self.mock_integration_action_list_json = json.load(list_actions_data)
+            cls.mock_integration_action_list_json = json.load(list_actions_data)
         with open(
             'tests/unit/mock_data/integration_action_definition_list.json'
         ) as list_action_definition_data:
-            self.mock_integration_action_definition_list = json.load(
+            cls.mock_integration_action_definition_list = json.load(
                 list_action_definition_data
             )
         with open(
             'tests/unit/mock_data/integration_action_list_unwrapped.json'
         ) as list_actions_data:
-            self.mock_integration_action_list_unwrapped_json = json.load(
+            cls.mock_integration_action_list_unwrapped_json = json.load(
                 list_actions_data
             )
         with open(
             'tests/unit/mock_data/integration_action_error_create.json'
         ) as create_action_errors_data:
-            self.mock_integration_action_error_create_json = json.load(
+            cls.mock_integration_action_error_create_json = json.load(
                 create_action_errors_data
             )
 
+    def setUp(self):
+        self.client = PaperlessClient()
+
+    def test_import_emits_no_runtime_warning(self):
+        # attrs warns when it cannot rebuild a slotted class whose methods reference super
+        result = subprocess.run(
+            [
+                sys.executable,
+                '-W',
+                'error::RuntimeWarning',
+                '-c',
+                'import paperless.objects.integration_actions',
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
     def test_get_managed_integration(self):
         self.client.get_resource = MagicMock(
             return_value=self.mock_managed_integration_json
@@ -98,6 +120,46 @@ class TestIntegrationAction(unittest.TestCase):
         self.assertIsInstance(int_act.updated_dt, datetime.date)
         self.assertIsInstance(int_act.last_checkin_dt, datetime.date)
 
+    def test_create_integration_action(self):
+        self.client.create_resource = MagicMock(
+            return_value=self.mock_integration_action_json
+        )
+        int_act = IntegrationAction(type="export_order", entity_id="1")
+        int_act.create(
+            managed_integration_uuid=self.mock_managed_integration_json['uuid']
+        )
+        self.assertEqual(int_act.uuid, "abc-123")
+        self.assertEqual(int_act.status, "queued")
+        self.assertEqual(int_act.current_record_count, 3)
+        self.assertEqual(int_act.last_checkin, "2021-12-13T12:47:26.063262Z")
+        copyable_fields = IntegrationAction._get_copyable_fields()
+        self.assertIs(copyable_fields, IntegrationAction._get_copyable_fields())
+        self.assertIs(IntegrationAction.__dict__['_copyable_fields'], copyable_fields)
+
+    def test_update_integration_action_skips_unchanged(self):
+        self.client.get_resource = MagicMock(
+            return_value=self.mock_integration_action_json
+        )
+        self.client.update_resource = MagicMock(
+            return_value=dict(self.mock_integration_action_json, status='completed')
+        )
+        int_act = IntegrationAction.get(id="abc-123")
+        self.assertFalse(int_act.has_local_changes())
+        int_act.update()
+        self.client.update_resource.assert_not_called()
+
+        int_act.status = 'completed'
+        self.assertTrue(int_act.has_local_changes())
+        int_act.update()
+        self.client.update_resource.assert_called_once()
+        self.assertFalse(int_act.has_local_changes())
+
+        int_act.update(force=True)
+        self.assertEqual(self.client.update_resource.call_count, 2)
+
+        new_act = IntegrationAction(type="export_order", uuid="abc-123")
+        self.assertTrue(new_act.has_local_changes())
+
     def test_list_integration_actions(self):
         self.client.get_resource_list = MagicMock(
             return_value=self.mock_integration_action_list_json
@@ -127,6 +189,137 @@ class TestIntegrationAction(unittest.TestCase):
         self.assertIsInstance(action_8.updated_dt, datetime.date)
         self.assertIsInstance(action_8.last_checkin_dt, datetime.date)
 
+    def test_list_integration_actions_paginated(self):
+        results = self.mock_integration_action_list_json['results']
+        first_page = {
+            'count': 8,
+            'next': 'https://api.paperlessparts.com/integration_actions?page=2',
+            'previous': None,
+            'results': results[:5],
+        }
+        second_page = {
+            'count': 8,
+            'next': None,
+            'previous': None,
+            'results': results[5:],
+        }
+        self.client.get_resource_list = MagicMock(side_effect=[first_page, second_page])
+        action_list = IntegrationAction.list(
+            managed_integration_uuid=self.mock_managed_integration_json['uuid'],
+            params={'status': 'queued'},
+        )
+        self.assertEqual(len(action_list), 8)
+        self.assertEqual(action_list[-1].uuid, "f9e8b33c-2361-47b2-ad23-c9390d488619")
+        _, second_call_kwargs = self.client.get_resource_list.call_args
+        self.assertEqual(second_call_kwargs['params']['status'], 'queued')
+        self.assertIn('page', second_call_kwargs['params'])
+
+    def test_list_integration_actions_cursor_paginated(self):
+        results = self.mock_integration_action_list_json['results']
+        first_page = {
+            'next': 'https://api.paperlessparts.com/integration_actions?cursor=cD0yMDIx%3D&status=completed',
+            'previous': None,
+            'results': results[:5],
+        }
+        second_page = {'next': None, 'previous': None, 'results': results[5:]}
+        self.client.get_resource_list = MagicMock(side_effect=[first_page, second_page])
+        action_list = IntegrationAction.list(
+            managed_integration_uuid=self.mock_managed_integration_json['uuid'],
+            params={'status': 'queued'},
+        )
+        self.assertEqual(len(action_list), 8)
+        self.assertEqual(self.client.get_resource_list.call_count, 2)
+        _, second_call_kwargs = self.client.get_resource_list.call_args
+        self.assertEqual(
+            second_call_kwargs['params'], {'cursor': 'cD0yMDIx=', 'status': 'queued'}
+        )
+
+    def test_list_integration_actions_concurrent_pages(self):
+        results = self.mock_integration_action_list_json['results']
+        count = 8
+
+        def get_page(list_url, params=None):
+            page = int((params or {}).get('page', 1))
+            next_page = page + 1 if page < 3 else None
+            return {
+                'count': count,
+                'next': None
+                if next_page is None
+                else f'https://api.paperlessparts.com/integration_actions?page={next_page}',
+                'previous': None,
+                'results': results[(page - 1) * 3 : page * 3],
+            }
+
+        self.client.get_resource_list = MagicMock(side_effect=get_page)
+        action_list = IntegrationAction.list(
+            managed_integration_uuid=self.mock_managed_integration_json['uuid'],
+            concurrent=True,
+        )
+        self.assertEqual([a.uuid for a in action_list], [r['uuid'] for r in results])
+        self.assertEqual(self.client.get_resource_list.call_count, 3)
+
+        # the first page undercounts, e.g. because actions were added while paging; the rest is followed serially
+        count = 5
+        action_list = IntegrationAction.list(
+            managed_integration_uuid=self.mock_managed_integration_json['uuid'],
+            concurrent=True,
+        )
+        self.assertEqual([a.uuid for a in action_list], [r['uuid'] for r in results])
+
+        action_list = IntegrationAction.list(
+            managed_integration_uuid=self.mock_managed_integration_json['uuid'],
+            pages=[3, 2],
+        )
+        self.assertEqual(
+            [a.uuid for a in action_list],
+            [r['uuid'] for r in results[6:] + results[3:6]],
+        )
+
+    @unittest.skipIf(ijson is None, 'ijson is not installed')
+    def test_list_integration_actions_streamed(self):
+        results = self.mock_integration_action_list_json['results']
+        pages = [
+            {
+                'next': 'https://api.paperlessparts.com/x?cursor=abc',
+                'results': results[:5],
+            },
+            {'next': None, 'results': results[5:]},
+        ]
+        responses = []
+        for page in pages:
+            response = MagicMock(status_code=200)
+            response.raw = io.BytesIO(json.dumps(page).encode())
+            responses.append(response)
+        self.client.access_token = 'test_accesstoken'
+        with patch('requests.get', side_effect=responses) as mock_get:
+            action_list = IntegrationAction.list(
+                managed_integration_uuid=self.mock_managed_integration_json['uuid'],
+                params={'page_size': 1000},
+            )
+        self.assertEqual([a.uuid for a in action_list], [r['uuid'] for r in results])
+        self.assertEqual(action_list[-1].current_record_count, 3)
+        _, second_call_kwargs = mock_get.call_args
+        self.assertTrue(second_call_kwargs['stream'])
+        self.assertEqual(
+            second_call_kwargs['params'], {'cursor': 'abc', 'page_size': 1000}
+        )
+
+    def test_filter_integration_actions(self):
+        self.client.get_resource_list = MagicMock(
+            return_value=self.mock_integration_action_list_json
+        )
+        IntegrationAction.filter(
+            managed_integration_uuid=self.mock_managed_integration_json['uuid'],
+            status='queued',
+        )
+        _, call_kwargs = self.client.get_resource_list.call_args
+        self.assertEqual(call_kwargs['params'], {'status': 'queued'})
+        IntegrationAction.filter(
+            managed_integration_uuid=self.mock_managed_integration_json['uuid']
+        )
+        _, call_kwargs = self.client.get_resource_list.call_args
+        self.assertIsNone(call_kwargs['params'])
+
     def test_list_integration_action_definitions(self):
         self.client.get_resource_list = MagicMock(
             return_value=self.mock_integration_action_definition_list
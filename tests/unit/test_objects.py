@@ -1,7 +1,13 @@
 import unittest
+from decimal import Decimal
 
+from paperless.objects.common import Money, convert_money
 from paperless.objects.quotes import CostingVariablePayload
-from paperless.objects.utils import safe_init
+from paperless.objects.utils import (
+    convert_decimal,
+    parse_next_query_params,
+    safe_init,
+)
 
 
 class TestObjects(unittest.TestCase):
@@ -18,3 +24,20 @@ class TestObjects(unittest.TestCase):
         d = safe_init(dict, dict(value=2, row=None, options=None, new_kwarg=1))
         self.assertTrue(isinstance(d, dict))
         self.assertEqual(2, d['value'])
+
+    def test_parse_next_query_params(self):
+        self.assertEqual(
+            {'cursor': 'cD0yMDIx=', 'page': '2'},
+            parse_next_query_params(
+                'https://api.paperlessparts.com/orders?cursor=cD0yMDIx%3D&page=2&empty='
+            ),
+        )
+        self.assertEqual({}, parse_next_query_params('https://api.paperlessparts.com'))
+
+    def test_convert_money_and_decimal(self):
+        self.assertIs(convert_money('12.50'), convert_money('12.50'))
+        self.assertEqual(convert_money('12.50').dollars, Decimal('12.50'))
+        money = Money(3)
+        self.assertIs(convert_money(money), money)
+        self.assertIs(convert_decimal('0.075'), convert_decimal('0.075'))
+        self.assertEqual(convert_decimal(2), Decimal(2))
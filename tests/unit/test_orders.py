@@ -1,31 +1,50 @@
+import datetime
+import functools
 import json
 import unittest
 from decimal import Decimal
-from unittest.mock import MagicMock
+from pathlib import Path
 
 from paperless.client import PaperlessClient
-from paperless.objects.components import ChildComponent
-from paperless.objects.orders import Order, OrderComponent
+from paperless.objects.orders import Order, OrderComponent, ShippingOption
+
+# depth-first component ids of the assembly order item in order.json
+EXPECTED_ASSEMBLY_ORDER = (
+    114384,
+    114390,
+    114389,
+    114391,
+    114388,
+    114387,
+    114386,
+    114385,
+)
+# base price of the assembly order item in order.json
+EXPECTED_BASE_PRICE = Decimal('2757.80')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture(file_name):
+    """Parse a mock_data fixture the first time a test class asks for it."""
+    return json.loads(Path('tests/unit/mock_data', file_name).read_bytes())
 
 
 class TestOrders(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # instantiate client singleton
-        self.client = PaperlessClient()
-        with open('tests/unit/mock_data/order.json') as data_file:
-            self.mock_order_json = json.load(data_file)
-
-        with open('tests/unit/mock_data/minimal_order.json') as data_file:
-            self.mock_minimal_order_json = json.load(data_file)
+        cls.client = PaperlessClient()
+        # none of the tests modify the fixture or the order, so both are built once
+        cls.mock_order_json = _load_fixture('order.json')
+        cls.client.get_resource = lambda *args, **kwargs: cls.mock_order_json
+        cls.full_order = Order.get(1)
 
     def test_get_order(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_order_json)
-        o: Order = Order.get(1)
+        o: Order = self.full_order
         self.assertEqual(o.number, 179)
         self.assertEqual('credit_card', o.payment_details.payment_type)
         self.assertEqual('pending', o.status)
         self.assertEqual(339, o.quote_number)
-        self.assertEqual(len(o.order_items), 3)
         # test salesperson
         sales_person = o.sales_person
         self.assertEqual(sales_person.first_name, 'Heathrow Chester')
@@ -34,29 +53,30 @@ class TestOrders(unittest.TestCase):
         self.assertEqual(estimator.first_name, 'Heathrow Chester')
         # test assembly order item
         assmb_oi = o.order_items[0]
-        self.assertEqual(len(assmb_oi.components), 8)
         assmb_root_component = assmb_oi.root_component
-        self.assertEqual(len(assmb_root_component.child_ids), 3)
-        self.assertEqual(assmb_root_component.deliver_quantity, 5)
-        self.assertIsNone(assmb_root_component.description)
-        self.assertFalse(assmb_root_component.export_controlled)
-        self.assertEqual(assmb_root_component.finishes, [])
-        self.assertEqual(assmb_root_component.innate_quantity, 1)
-        self.assertTrue(assmb_root_component.is_root_component)
-        self.assertEqual(assmb_root_component.make_quantity, 5)
         self.assertEqual(assmb_root_component.material.family, 'Aluminum')
-        self.assertEqual(len(assmb_root_component.material_operations), 0)
-        self.assertEqual(len(assmb_root_component.parent_ids), 0)
-        self.assertEqual(assmb_root_component.part_name, 'small-sub-assembly.STEP')
-        self.assertIsNone(assmb_root_component.part_number)
+        self.assertEqual(assmb_root_component.process.name, 'CNC Machining')
+        expected_root_fields = {
+            'deliver_quantity': 5,
+            'description': None,
+            'export_controlled': False,
+            'finishes': [],
+            'innate_quantity': 1,
+            'is_root_component': True,
+            'make_quantity': 5,
+            'part_name': 'small-sub-assembly.STEP',
+            'part_number': None,
+            'part_uuid': 'ddab27ae-ff7b-4db2-be24-41002be6cb58',
+            'revision': None,
+            'type': 'assembled',
+        }
         self.assertEqual(
-            assmb_root_component.part_uuid, 'ddab27ae-ff7b-4db2-be24-41002be6cb58'
+            expected_root_fields,
+            {
+                name: getattr(assmb_root_component, name)
+                for name in expected_root_fields
+            },
         )
-        self.assertEqual(assmb_root_component.process.name, 'CNC Machining')
-        self.assertIsNone(assmb_root_component.revision)
-        self.assertEqual(len(assmb_root_component.shop_operations), 1)
-        self.assertEqual(len(assmb_root_component.supporting_files), 1)
-        self.assertEqual(assmb_root_component.type, 'assembled')
 
         op = assmb_root_component.shop_operations[0]
         self.assertEqual('304-#4', op.get_variable('Material Selection'))
@@ -64,11 +84,37 @@ class TestOrders(unittest.TestCase):
 
         # test single component order item
         standard_oi = o.order_items[1]
-        self.assertEqual(len(standard_oi.components), 1)
         self.assertEqual(standard_oi.add_on_fees.dollars, Decimal('50'))
         root_component = standard_oi.root_component
-        self.assertEqual(len(root_component.material_operations), 2)
-        self.assertEqual(len(root_component.shop_operations), 8)
+
+        length_checks = (
+            ('order_items', o.order_items, 3),
+            ('assembly components', assmb_oi.components, 8),
+            ('assembly root child_ids', assmb_root_component.child_ids, 3),
+            (
+                'assembly root material_operations',
+                assmb_root_component.material_operations,
+                0,
+            ),
+            ('assembly root parent_ids', assmb_root_component.parent_ids, 0),
+            ('assembly root shop_operations', assmb_root_component.shop_operations, 1),
+            (
+                'assembly root supporting_files',
+                assmb_root_component.supporting_files,
+                1,
+            ),
+            ('standard components', standard_oi.components, 1),
+            (
+                'standard root material_operations',
+                root_component.material_operations,
+                2,
+            ),
+            ('standard root shop_operations', root_component.shop_operations, 8),
+        )
+        for name, sequence, expected_length in length_checks:
+            with self.subTest(name):
+                self.assertEqual(len(sequence), expected_length)
+
         finish_op = root_component.shop_operations[6]
         self.assertEqual(finish_op.name, 'Chromate')
         self.assertEqual(finish_op.operation_definition_name, 'Chromate')
@@ -145,7 +191,7 @@ class TestOrders(unittest.TestCase):
 
         # test add ons
         other_oi = o.order_items[0]
-        self.assertEqual(other_oi.base_price.dollars, Decimal('2757.80'))
+        self.assertEqual(other_oi.base_price.dollars, EXPECTED_BASE_PRICE)
         add_on = other_oi.ordered_add_ons[0]
         self.assertEqual(add_on.quantity, 5)
         self.assertEqual(add_on.add_on_definition_erp_code, "add_on_def erp_code")
@@ -162,18 +208,8 @@ class TestOrders(unittest.TestCase):
         self.assertEqual(supplier_facility.name, "Paperless Parts")
         self.assertEqual(supplier_facility.is_default, True)
 
-    def test_order_null_fields(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_minimal_order_json)
-        o = Order.get(1)
-        self.assertEqual(o.billing_info, None)
-        self.assertEqual(o.shipping_info, None)
-        self.assertEqual(o.payment_details.payment_type, None)
-        self.assertEqual(o.shipping_option, None)
-        self.assertEqual(o.send_from_facility, None)
-
     def test_date_fmt(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_order_json)
-        o = Order.get(1)
+        o = self.full_order
         oi = o.order_items[0]
         self.assertEqual(2020, oi.ships_on_dt.year)
         self.assertEqual(12, oi.ships_on_dt.month)
@@ -182,72 +218,19 @@ class TestOrders(unittest.TestCase):
         self.assertEqual(12, o.created_dt.month)
         self.assertEqual(8, o.created_dt.day)
 
-    def test_ship_desc(self):
-        from paperless.objects.orders import ShippingOption
-        import datetime
-
-        dt = datetime.datetime.now()
-
-        # pickup
-        so1 = ShippingOption(
-            customers_account_number=None,
-            customers_carrier=None,
-            shipping_method=None,
-            type='pickup',
-        )
-        self.assertTrue(
-            so1.summary(dt, '').startswith(
-                'Customer will pickup from supplier\'s location.'
-            )
-        )
-
-        # customer's account
-        so2 = ShippingOption(
-            customers_account_number='12345',
-            customers_carrier='ups',
-            shipping_method='ground',
-            type='customers_shipping_account',
-        )
-        self.assertIn('Use Customer\'s Shipping Account', so2.summary(dt, ''))
-        self.assertIn('Method: GROUND', so2.summary(dt, ''))
-
-        # supplier's account
-        so3 = ShippingOption(
-            customers_account_number=None,
-            customers_carrier=None,
-            shipping_method='ground',
-            type='suppliers_shipping_account',
-        )
-        summ = so3.summary(dt, 'credit_card')
-        self.assertIn('has been charged', summ)
-        summ = so3.summary(dt, 'purchase_order')
-        self.assertIn('bill customer', summ)
-
     def test_assemblies(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_order_json)
-        o = Order.get(1)
+        o = self.full_order
         oi = o.order_items[0]
         assm = list(oi.iterate_assembly())
         self.assertEqual(8, len(assm))
         self.assertTrue(assm[0].component.is_root_component)
         self.assertEqual(0, assm[0].level)
-        expected_order = [
-            114384,
-            114390,
-            114389,
-            114391,
-            114388,
-            114387,
-            114386,
-            114385,
-        ]
-        self.assertEqual(expected_order, [c.component.id for c in assm])
+        self.assertEqual(EXPECTED_ASSEMBLY_ORDER, tuple(c.component.id for c in assm))
         self.assertEqual(2, assm[4].level)
         self.assertEqual(4, assm[4].level_count)
 
     def test_billing_info(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_order_json)
-        o = Order.get(1)
+        o = self.full_order
         billing_info = o.billing_info
         self.assertEqual(billing_info.address1, "1 FISKE TER")
         self.assertEqual(billing_info.address2, "")
@@ -260,9 +243,75 @@ class TestOrders(unittest.TestCase):
         self.assertEqual(billing_info.postal_code, "02134-4503")
         self.assertEqual(billing_info.state, "MA")
 
+    def test_hardware(self):
+        o = self.full_order
+        oi = o.order_items[0]
+        components_by_id = {c.id: c for c in oi.components}
+        children_by_parent = {
+            p.id: {c.child_id: c.quantity for c in p.children}
+            for p in oi.components
+            if p.type == 'assembled'
+        }
+        by_part = {oc.part_number: oc for oc in oi.components}
+        self.assertIn('AC-M6-2', by_part)
+        pc: OrderComponent = by_part['AC-M6-2']
+        self.assertTrue(pc.is_hardware)
+        self.assertTrue(all(not oc.is_hardware for oc in oi.components if oc is not pc))
+        # test purchased component
+        self.assertEqual('AC-M6-2', pc.purchased_component.oem_part_number)
+        self.assertIsNone(pc.purchased_component.internal_part_number)
+        self.assertIsNone(pc.purchased_component.description)
+        self.assertEqual(
+            Decimal('0.9310'), pc.purchased_component.piece_price.raw_amount
+        )
+        self.assertEqual(Decimal('0.93'), pc.purchased_component.piece_price.dollars)
+        self.assertEqual(pc.purchased_component.get_property('brand'), "Penn")
+        self.assertEqual(pc.purchased_component.get_property('lead_time'), 4)
+        self.assertEqual(pc.purchased_component.get_property('in_stock'), True)
+        self.assertIsNone(pc.purchased_component.get_property("bad_name"))
+        total_q = 0
+        for parent_id in pc.parent_ids:
+            parent = components_by_id[parent_id]
+            self.assertEqual('assembled', parent.type)
+            total_q += children_by_parent[parent_id][pc.id]
+        self.assertEqual(1, total_q)
+        # the parents above come from a local index, so check OrderItem's own lookup directly
+        self.assertIs(oi.get_component(oi.root_component.id), oi.root_component)
+
+    def test_shipping_info(self):
+        o = self.full_order
+        shipping_info = o.shipping_info
+        self.assertEqual(shipping_info.address1, "1 FISKE TER")
+        self.assertEqual(shipping_info.address2, "")
+        self.assertEqual(shipping_info.business_name, "Outside Firm")
+        self.assertEqual(shipping_info.city, "BOSTON")
+        self.assertEqual(shipping_info.country, "USA")
+        self.assertEqual(shipping_info.attention, "Cus Tomer")
+        self.assertEqual(shipping_info.phone, "5555555555")
+        self.assertEqual(shipping_info.phone_ext, "")
+        self.assertEqual(shipping_info.postal_code, "02134-4503")
+        self.assertEqual(shipping_info.state, "MA")
+
+
+class TestMinimalOrder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # instantiate client singleton
+        cls.client = PaperlessClient()
+        cls.mock_minimal_order_json = _load_fixture('minimal_order.json')
+        cls.client.get_resource = lambda *args, **kwargs: cls.mock_minimal_order_json
+        cls.minimal_order = Order.get(1)
+
+    def test_order_null_fields(self):
+        o = self.minimal_order
+        self.assertEqual(o.billing_info, None)
+        self.assertEqual(o.shipping_info, None)
+        self.assertEqual(o.payment_details.payment_type, None)
+        self.assertEqual(o.shipping_option, None)
+        self.assertEqual(o.send_from_facility, None)
+
     def test_contact(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_minimal_order_json)
-        o = Order.get(1)
+        o = self.minimal_order
         c = o.contact
         a = c.account
         self.assertEqual(c.id, 3545)
@@ -280,8 +329,7 @@ class TestOrders(unittest.TestCase):
         self.assertEqual(c.phone_ext, "")
 
     def test_customer(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_minimal_order_json)
-        o = Order.get(1)
+        o = self.minimal_order
         cu = o.customer
         co = cu.company
         self.assertIsNone(cu.id)
@@ -295,55 +343,46 @@ class TestOrders(unittest.TestCase):
         self.assertEqual(cu.phone, "")
         self.assertEqual(cu.phone_ext, "")
 
-    def test_hardware(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_order_json)
-        o = Order.get(1)
-        oi = o.order_items[0]
-        found_hardware = False
-        total_q = 0
-        oc: OrderComponent
-        for oc in oi.components:
-            if oc.part_number == 'AC-M6-2':
-                self.assertTrue(oc.is_hardware)
-                # test purchased component
-                pc = oc
-                self.assertEqual('AC-M6-2', pc.purchased_component.oem_part_number)
-                self.assertIsNone(pc.purchased_component.internal_part_number)
-                self.assertIsNone(pc.purchased_component.description)
-                self.assertEqual(
-                    Decimal('0.9310'), pc.purchased_component.piece_price.raw_amount
-                )
-                self.assertEqual(
-                    Decimal('0.93'), pc.purchased_component.piece_price.dollars
-                )
-                self.assertEqual(pc.purchased_component.get_property('brand'), "Penn")
-                self.assertEqual(pc.purchased_component.get_property('lead_time'), 4)
-                self.assertEqual(pc.purchased_component.get_property('in_stock'), True)
-                self.assertIsNone(pc.purchased_component.get_property("bad_name"))
-                found_hardware = True
-                for parent_id in oc.parent_ids:
-                    parent = oi.get_component(parent_id)
-                    self.assertEqual('assembled', parent.type)
-                    child: ChildComponent
-                    for child in parent.children:
-                        if child.child_id == oc.id:
-                            total_q += child.quantity
-            else:
-                self.assertFalse(oc.is_hardware)
-        self.assertTrue(found_hardware)
-        self.assertEqual(1, total_q)
 
-    def test_shipping_info(self):
-        self.client.get_resource = MagicMock(return_value=self.mock_order_json)
-        o = Order.get(1)
-        shipping_info = o.shipping_info
-        self.assertEqual(shipping_info.address1, "1 FISKE TER")
-        self.assertEqual(shipping_info.address2, "")
-        self.assertEqual(shipping_info.business_name, "Outside Firm")
-        self.assertEqual(shipping_info.city, "BOSTON")
-        self.assertEqual(shipping_info.country, "USA")
-        self.assertEqual(shipping_info.attention, "Cus Tomer")
-        self.assertEqual(shipping_info.phone, "5555555555")
-        self.assertEqual(shipping_info.phone_ext, "")
-        self.assertEqual(shipping_info.postal_code, "02134-4503")
-        self.assertEqual(shipping_info.state, "MA")
+class TestShippingOption(unittest.TestCase):
+    def test_ship_desc(self):
+        dt = datetime.datetime(2020, 12, 28)
+        suppliers_account = dict(
+            customers_account_number=None,
+            customers_carrier=None,
+            shipping_method='ground',
+            type='suppliers_shipping_account',
+        )
+        # (shipping option fields, payment type, expected prefix, expected substrings)
+        cases = (
+            (
+                dict(
+                    customers_account_number=None,
+                    customers_carrier=None,
+                    shipping_method=None,
+                    type='pickup',
+                ),
+                '',
+                'Customer will pickup from supplier\'s location.',
+                (),
+            ),
+            (
+                dict(
+                    customers_account_number='12345',
+                    customers_carrier='ups',
+                    shipping_method='ground',
+                    type='customers_shipping_account',
+                ),
+                '',
+                '',
+                ('Use Customer\'s Shipping Account', 'Method: GROUND'),
+            ),
+            (suppliers_account, 'credit_card', '', ('has been charged',)),
+            (suppliers_account, 'purchase_order', '', ('bill customer',)),
+        )
+        for fields, payment_type, prefix, substrings in cases:
+            with self.subTest(type=fields['type'], payment_type=payment_type):
+                summ = ShippingOption(**fields).summary(dt, payment_type)
+                self.assertTrue(summ.startswith(prefix))
+                for substring in substrings:
+                    self.assertIn(substring, summ)
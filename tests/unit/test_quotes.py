@@ -1,3 +1,4 @@
+import copy
 import json
 import unittest
 from decimal import Decimal
@@ -71,6 +72,8 @@ class TestQuotes(unittest.TestCase):
         self.assertFalse(
             root_component.part_custom_attrs
         )  # Note - this could either be None or a list, this confirms it is either None or an empty list
+        self.assertIs(quote_item.get_component(root_component.id), root_component)
+        self.assertIsNone(quote_item.get_component(-1))
         # test addons
         add_on = root_component.add_ons[0]
         self.assertEqual(add_on.is_required, True)
@@ -612,3 +615,12 @@ class TestQuotes(unittest.TestCase):
         self.assertEqual(supplier_facility.id, 1)
         self.assertEqual(supplier_facility.name, "Paperless Parts")
         self.assertEqual(supplier_facility.is_default, True)
+
+    def test_quote_equality(self):
+        self.client.get_resource = MagicMock(return_value=self.mock_quote_json)
+        q = Quote.get(1)
+        q.quote_items[0].get_component(q.quote_items[0].components[0].id)
+        self.assertEqual(q, Quote.get(1))
+        self.assertEqual(q.quote_items[0], copy.deepcopy(q.quote_items[0]))
+        self.assertEqual(q.customer, copy.deepcopy(q.customer))
+        self.assertEqual(q.contact, copy.deepcopy(q.contact))